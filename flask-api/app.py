@@ -1,11 +1,17 @@
-from flask import Flask, request, jsonify, redirect, session
+from flask import Flask, request, jsonify, redirect, session, Response, abort
 from flask_cors import CORS
 import sqlite3
 import json
 import os
+import gzip
 import hashlib
 import secrets
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 from py_backend import (
     backend_init, backend_add_city, backend_add_road,
     backend_shortest_path_json, backend_graph_json,
@@ -110,6 +116,82 @@ def restore_state():
 restore_state()
 
 
+# ─── Static asset cache ──────────────────────────────────────────────────────
+# Pages are read once at startup and kept in memory together with their
+# gzip/brotli encodings and a content hash used as the ETag.
+_asset_cache = {}
+
+
+def build_asset(body, mimetype, mtime=None):
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    encodings = {'identity': body}
+
+    gz = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(gz) < len(body):
+        encodings['gzip'] = gz
+
+    if brotli is not None:
+        br = brotli.compress(body, quality=11)
+        if len(br) < len(body):
+            encodings['br'] = br
+
+    return {'etag': digest, 'mimetype': mimetype, 'mtime': mtime, 'encodings': encodings}
+
+
+def load_page(filename):
+    path = os.path.join(app.static_folder, filename)
+    mtime = os.stat(path).st_mtime
+    with open(path, 'rb') as f:
+        body = f.read()
+    _asset_cache[filename] = build_asset(body, 'text/html', mtime)
+    return _asset_cache[filename]
+
+
+def preload_pages():
+    for filename in sorted(os.listdir(app.static_folder)):
+        if filename.endswith('.html'):
+            load_page(filename)
+
+
+def get_page(filename):
+    asset = _asset_cache.get(filename)
+    try:
+        if asset is None:
+            return load_page(filename)
+        if app.debug:
+            path = os.path.join(app.static_folder, filename)
+            if os.stat(path).st_mtime != asset['mtime']:
+                return load_page(filename)
+    except OSError:
+        _asset_cache.pop(filename, None)
+        abort(404)
+    return asset
+
+
+def send_asset(asset):
+    encoding = 'identity'
+    accepted = request.accept_encodings
+    for candidate in ('br', 'gzip'):
+        if candidate in asset['encodings'] and accepted[candidate]:
+            encoding = candidate
+            break
+
+    resp = Response(asset['encodings'][encoding], mimetype=asset['mimetype'])
+    if encoding != 'identity':
+        resp.headers['Content-Encoding'] = encoding
+    resp.headers['Vary'] = 'Accept-Encoding'
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    resp.set_etag(asset['etag'] if encoding == 'identity' else f"{asset['etag']}-{encoding}")
+    return resp.make_conditional(request)
+
+
+def send_page(filename):
+    return send_asset(get_page(filename))
+
+
+preload_pages()
+
+
 # ─── Auth helpers ────────────────────────────────────────────────────────────
 def login_required(f):
     from functools import wraps
@@ -126,65 +208,65 @@ def login_required(f):
 @app.route('/')
 @login_required
 def index():
-    return app.send_static_file('index.html')
+    return send_page('index.html')
 
 
 @app.route('/login')
 def login_page():
-    return app.send_static_file('login.html')
+    return send_page('login.html')
 
 
 @app.route('/signup')
 def signup_page():
-    return app.send_static_file('signup.html')
+    return send_page('signup.html')
 
 
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    return app.send_static_file('index.html')
+    return send_page('index.html')
 
 
 @app.route('/cities')
 @login_required
 def cities_page():
-    return app.send_static_file('cities.html')
+    return send_page('cities.html')
 
 
 @app.route('/roads')
 @login_required
 def roads_page():
-    return app.send_static_file('roads.html')
+    return send_page('roads.html')
 
 
 @app.route('/requests')
 @login_required
 def requests_page():
-    return app.send_static_file('requests.html')
+    return send_page('requests.html')
 
 
 @app.route('/allocate')
 @login_required
 def allocate_page():
-    return app.send_static_file('allocate.html')
+    return send_page('allocate.html')
 
 
 @app.route('/logs')
 @login_required
 def logs_page():
-    return app.send_static_file('logs.html')
+    return send_page('logs.html')
 
 
 @app.route('/map')
 @login_required
 def map_page():
-    return app.send_static_file('map.html')
+    return send_page('map.html')
 
 
 @app.route('/emergency')
 @login_required
 def emergency_page():
-    return app.send_static_file('emergency.html')
+    return send_page('emergency.html')
 
 
 # ─── Auth API ────────────────────────────────────────────────────────────────
@@ -418,24 +500,29 @@ def shortest_path():
 
 
 # ─── Emergency Numbers API ──────────────────────────────────────────────────
+EMERGENCY_NUMBERS = [
+    {"name": "National Disaster Response Force (NDRF)", "number": "011-24363260", "category": "Disaster", "icon": "shield-alt"},
+    {"name": "National Emergency Number", "number": "112", "category": "Emergency", "icon": "phone-alt"},
+    {"name": "Police", "number": "100", "category": "Law Enforcement", "icon": "user-shield"},
+    {"name": "Fire Brigade", "number": "101", "category": "Fire", "icon": "fire-extinguisher"},
+    {"name": "Ambulance", "number": "102", "category": "Medical", "icon": "ambulance"},
+    {"name": "Disaster Management (NDMA)", "number": "1078", "category": "Disaster", "icon": "house-damage"},
+    {"name": "Women Helpline", "number": "1091", "category": "Safety", "icon": "female"},
+    {"name": "Child Helpline", "number": "1098", "category": "Safety", "icon": "child"},
+    {"name": "Road Accident Emergency", "number": "1073", "category": "Accident", "icon": "car-crash"},
+    {"name": "Earthquake / Flood / Disaster", "number": "011-26701728", "category": "Disaster", "icon": "water"},
+    {"name": "Indian Red Cross Society", "number": "011-23359379", "category": "Relief", "icon": "plus-square"},
+    {"name": "Air Ambulance", "number": "9540161344", "category": "Medical", "icon": "helicopter"},
+]
+_emergency_numbers_asset = build_asset(
+    json.dumps({'numbers': EMERGENCY_NUMBERS}).encode('utf-8'), 'application/json'
+)
+
+
 @app.route('/api/emergency-numbers', methods=['GET'])
 @login_required
 def emergency_numbers():
-    numbers = [
-        {"name": "National Disaster Response Force (NDRF)", "number": "011-24363260", "category": "Disaster", "icon": "shield-alt"},
-        {"name": "National Emergency Number", "number": "112", "category": "Emergency", "icon": "phone-alt"},
-        {"name": "Police", "number": "100", "category": "Law Enforcement", "icon": "user-shield"},
-        {"name": "Fire Brigade", "number": "101", "category": "Fire", "icon": "fire-extinguisher"},
-        {"name": "Ambulance", "number": "102", "category": "Medical", "icon": "ambulance"},
-        {"name": "Disaster Management (NDMA)", "number": "1078", "category": "Disaster", "icon": "house-damage"},
-        {"name": "Women Helpline", "number": "1091", "category": "Safety", "icon": "female"},
-        {"name": "Child Helpline", "number": "1098", "category": "Safety", "icon": "child"},
-        {"name": "Road Accident Emergency", "number": "1073", "category": "Accident", "icon": "car-crash"},
-        {"name": "Earthquake / Flood / Disaster", "number": "011-26701728", "category": "Disaster", "icon": "water"},
-        {"name": "Indian Red Cross Society", "number": "011-23359379", "category": "Relief", "icon": "plus-square"},
-        {"name": "Air Ambulance", "number": "9540161344", "category": "Medical", "icon": "helicopter"},
-    ]
-    return jsonify({'numbers': numbers})
+    return send_asset(_emergency_numbers_asset)
 
 
 # ─── Run ─────────────────────────────────────────────────────────────────────
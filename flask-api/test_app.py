@@ -0,0 +1,74 @@
+import gzip
+import json
+import os
+
+import pytest
+from werkzeug.exceptions import NotFound
+
+from app import app, get_page, EMERGENCY_NUMBERS
+
+MAP_PATH = os.path.join(app.static_folder, 'map.html')
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['user_id'] = 1
+            sess['username'] = 'tester'
+        yield client
+
+
+def read_map():
+    with open(MAP_PATH, 'rb') as f:
+        return f.read()
+
+
+def test_page_gzip(client):
+    resp = client.get('/map', headers={'Accept-Encoding': 'gzip'})
+    assert resp.status_code == 200
+    assert resp.headers['Content-Type'] == 'text/html; charset=utf-8'
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in resp.headers['Vary']
+    assert gzip.decompress(resp.get_data()) == read_map()
+
+
+@pytest.mark.parametrize('headers', [{'Accept-Encoding': 'gzip;q=0'}, {}])
+def test_page_uncompressed(client, headers):
+    resp = client.get('/map', headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers['Content-Type'] == 'text/html; charset=utf-8'
+    assert 'Content-Encoding' not in resp.headers
+    assert resp.get_data() == read_map()
+
+
+def test_page_not_modified(client):
+    etag = client.get('/map', headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+    resp = client.get('/map', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert resp.status_code == 304
+    assert resp.get_data() == b''
+
+
+def test_page_etag_from_other_encoding(client):
+    etag = client.get('/map').headers['ETag']
+    resp = client.get('/map', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert resp.status_code == 200
+    assert gzip.decompress(resp.get_data()) == read_map()
+
+
+def test_missing_page_is_404():
+    with app.test_request_context():
+        with pytest.raises(NotFound):
+            get_page('missing.html')
+
+
+def test_emergency_numbers(client):
+    for headers in ({'Accept-Encoding': 'gzip'}, {}):
+        resp = client.get('/api/emergency-numbers', headers=headers)
+        assert resp.status_code == 200
+        assert resp.headers['Content-Type'] == 'application/json'
+        body = resp.get_data()
+        if resp.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        assert json.loads(body) == {'numbers': EMERGENCY_NUMBERS}